@@ -103,6 +103,9 @@ def direct_beam(pipeline: Pipeline, I0: sc.Variable, niter: int = 5) -> List[dic
     pipeline = pipeline.copy()
 
     wavelength_bins = pipeline.compute(WavelengthBins)
+    # The resampled direct beam always has the same bin-edges, so the midpoints used
+    # for scaling the denominator terms can be computed once for all iterations.
+    wavelength_midpoints = sc.midpoints(wavelength_bins, dim='wavelength')
     parts = (
         FinalSummedQ[SampleRun, Numerator],
         FinalSummedQ[SampleRun, Denominator],
@@ -158,9 +161,7 @@ def direct_beam(pipeline: Pipeline, I0: sc.Variable, niter: int = 5) -> List[dic
             direct_beam=direct_beam_function,
             wavelength_bins=wavelength_bins,
         )
-        db.coords['wavelength'] = sc.midpoints(
-            db.coords['wavelength'], dim='wavelength'
-        )
+        db.coords['wavelength'] = wavelength_midpoints
         pipeline[FinalSummedQ[SampleRun, Denominator]] = sample0 * db
         pipeline[FinalSummedQ[BackgroundRun, Denominator]] = background0 * db
 
@@ -4,6 +4,7 @@
 import uuid
 from typing import Optional
 
+import numpy as np
 import sciline
 import scipp as sc
 from scipp.scipy.interpolate import interp1d
@@ -40,6 +41,58 @@ from .types import (
 from .uncertainty import broadcast_with_upper_bound_variances
 
 
+def _mean_outside_range(monitor: sc.DataArray, data_range: sc.Variable) -> sc.Variable:
+    """
+    Compute the mean of the monitor counts outside of ``data_range``.
+
+    This is equivalent to ``mask_range(monitor, mask=mask).mean()`` with a mask that
+    is ``True`` inside the range. For dense one-dimensional monitors without masks,
+    the range is located with a binary search on the coordinate and the mean is
+    computed from the slices on either side, without constructing a masked copy.
+    """
+    dim = data_range.dim
+    if (
+        monitor.bins is None
+        and monitor.ndim == 1
+        and not monitor.masks
+        and dim in monitor.coords
+        and monitor.coords[dim].dims == (monitor.dim,)
+        and sc.issorted(monitor.coords[dim], monitor.dim).value
+    ):
+        coord = monitor.coords[dim]
+        low, high = data_range.to(unit=coord.unit).values
+        # Coordinate values in [low, high) are inside the range
+        start, stop = np.searchsorted(coord.values, [low, high])
+        if monitor.coords.is_edges(dim) and stop > start:
+            # A bin is inside the range if either of its edges is
+            start = max(start - 1, 0)
+            stop = min(stop, monitor.shape[0])
+        count = monitor.shape[0] - (stop - start)
+        # A reversed range is rejected by mask_range below
+        if low <= high and count > 0:
+            values = monitor.values
+            variances = monitor.variances
+            return sc.scalar(
+                (values[:start].sum() + values[stop:].sum()) / count,
+                variance=None
+                if variances is None
+                else (variances[:start].sum() + variances[stop:].sum()) / count**2,
+                unit=monitor.unit,
+            )
+    mask = sc.DataArray(
+        data=sc.array(dims=[dim], values=[True]),
+        coords={dim: data_range},
+    )
+    return mask_range(monitor, mask=mask).mean().data
+
+
+_background_broadcasters = {
+    UncertaintyBroadcastMode.drop: lambda background, sizes: sc.values(background),
+    UncertaintyBroadcastMode.upper_bound: broadcast_with_upper_bound_variances,
+    UncertaintyBroadcastMode.fail: lambda background, sizes: background,
+}
+
+
 def preprocess_monitor_data(
     monitor: WavelengthMonitor[RunType, MonitorType],
     wavelength_bins: WavelengthBins,
@@ -77,11 +130,7 @@ def preprocess_monitor_data(
     """
     background = None
     if non_background_range is not None:
-        mask = sc.DataArray(
-            data=sc.array(dims=[non_background_range.dim], values=[True]),
-            coords={non_background_range.dim: non_background_range},
-        )
-        background = mask_range(monitor, mask=mask).mean()
+        background = _mean_outside_range(monitor, non_background_range)
 
     if monitor.bins is not None:
         monitor = monitor.hist(wavelength=wavelength_bins)
@@ -89,17 +138,41 @@ def preprocess_monitor_data(
         monitor = monitor.rebin(wavelength=wavelength_bins)
 
     if background is not None:
-        if uncertainties == UncertaintyBroadcastMode.drop:
-            monitor -= sc.values(background)
-        elif uncertainties == UncertaintyBroadcastMode.upper_bound:
-            monitor -= broadcast_with_upper_bound_variances(
-                background, sizes=monitor.sizes
-            )
-        else:
-            monitor -= background
+        broadcast = _background_broadcasters[uncertainties]
+        monitor -= broadcast(background, sizes=monitor.sizes)
     return CleanMonitor(monitor)
 
 
+def _is_same_binning(coord: sc.Variable, bins: sc.Variable) -> bool:
+    """
+    Equivalent to ``sc.identical(coord, bins)`` for bin edges, but compares cheap
+    properties (dims, shape, unit, dtype and end points) first. This rejects differing
+    binnings and accepts variables sharing the same buffer without comparing every
+    element.
+    """
+    if (
+        coord.dims != bins.dims
+        or coord.shape != bins.shape
+        or coord.unit != bins.unit
+        or coord.dtype != bins.dtype
+    ):
+        return False
+    if coord.ndim != 1 or coord.shape[0] == 0:
+        return sc.identical(coord, bins)
+    values = coord.values
+    other = bins.values
+    if values[0] != other[0] or values[-1] != other[-1]:
+        return False
+    if (
+        coord.variances is None
+        and bins.variances is None
+        and values.ctypes.data == other.ctypes.data
+        and values.strides == other.strides
+    ):
+        return True
+    return sc.identical(coord, bins)
+
+
 def resample_direct_beam(
     direct_beam: DirectBeam, wavelength_bins: WavelengthBins
 ) -> CleanDirectBeam:
@@ -120,7 +193,7 @@ def resample_direct_beam(
     :
         The direct beam function resampled to the requested resolution.
     """
-    if sc.identical(direct_beam.coords['wavelength'], wavelength_bins):
+    if _is_same_binning(direct_beam.coords['wavelength'], wavelength_bins):
         return direct_beam
     if direct_beam.variances is not None:
         logger = get_logger('sans')
@@ -224,7 +297,9 @@ def bin_in_q(
                 .drop_coords(dims_to_keep or ())
                 .hist(**edges)
             )
-    return CleanSummedQ[ScatteringRunType, IofQPart](out.squeeze())
+    if 1 in out.shape:
+        out = out.squeeze()
+    return CleanSummedQ[ScatteringRunType, IofQPart](out)
 
 
 def no_bank_merge(
@@ -3,6 +3,7 @@
 
 from typing import Optional
 
+import numpy as np
 import scipp as sc
 from scipp.core import concepts
 
@@ -18,6 +19,7 @@ from .types import (
     Incident,
     IofQ,
     LabFrameTransform,
+    NormalizationDType,
     NormWavelengthTerm,
     Numerator,
     ProcessedWavelengthBands,
@@ -119,11 +121,21 @@ def _approximate_solid_angle_for_cylinder_shaped_pixel_of_detector(
     and :math:`\hat{r}` is the normalized pixel position vector.
     """
     norm_pp = sc.norm(pixel_position)
-    norm_ca = sc.norm(cylinder_axis)
-    cosalpha = sc.sqrt(
-        1 - (sc.dot(pixel_position, cylinder_axis) / (norm_pp * norm_ca)) ** 2
-    )
-    return (2 * radius * length) * cosalpha / norm_pp**2
+    # The terms below are computed in-place on a single pixel-sized buffer to avoid
+    # allocating a temporary for every intermediate result.
+    omega = sc.dot(pixel_position, cylinder_axis)
+    omega /= norm_pp
+    omega /= sc.norm(cylinder_axis)
+    # cos(alpha) = sqrt(1 - (r.c / (|r| |c|))^2)
+    omega *= omega
+    omega *= -1.0
+    omega += 1.0
+    sc.sqrt(omega, out=omega)
+    # Divide by |r|^2, reusing the buffer of |r|
+    norm_pp *= norm_pp
+    omega /= norm_pp
+    omega *= 2 * radius * length
+    return omega
 
 
 def transmission_fraction(
@@ -159,9 +171,20 @@ def transmission_fraction(
     :
         The transmission fraction computed from the monitor counts.
     """  # noqa: E501
-    frac = (sample_transmission_monitor / direct_transmission_monitor) * (
-        direct_incident_monitor / sample_incident_monitor
-    )
+    frac = sample_transmission_monitor / direct_transmission_monitor
+    incident = (direct_incident_monitor, sample_incident_monitor)
+    if all(
+        monitor.dtype == frac.dtype
+        and (frac.variances is not None or monitor.variances is None)
+        for monitor in incident
+    ):
+        # Reuse the buffer of the first quotient for the remaining operations instead
+        # of allocating a temporary for each of them. In-place operations neither
+        # promote the dtype nor add variances, so this requires matching inputs.
+        frac *= direct_incident_monitor
+        frac /= sample_incident_monitor
+    else:
+        frac = frac * (direct_incident_monitor / sample_incident_monitor)
     return TransmissionFraction[ScatteringRunType](frac)
 
 
@@ -172,11 +195,16 @@ _broadcasters = {
 }
 
 
+def _astype(da: sc.DataArray, dtype: Optional[NormalizationDType]) -> sc.DataArray:
+    return da if dtype is None else da.astype(dtype, copy=False)
+
+
 def iofq_norm_wavelength_term(
     incident_monitor: CleanMonitor[ScatteringRunType, Incident],
     transmission_fraction: TransmissionFraction[ScatteringRunType],
     direct_beam: Optional[CleanDirectBeam],
     uncertainties: UncertaintyBroadcastMode,
+    dtype: Optional[NormalizationDType],
 ) -> NormWavelengthTerm[ScatteringRunType]:
     """
     Compute the wavelength-dependent contribution to the denominator term for the I(Q)
@@ -206,6 +234,9 @@ def iofq_norm_wavelength_term(
     uncertainties:
         The mode for broadcasting uncertainties. See
         :py:class:`UncertaintyBroadcastMode` for details.
+    dtype:
+        The data type to use for the computation. If ``None``, the data type of the
+        inputs is kept.
 
     Returns
     -------
@@ -215,15 +246,29 @@ def iofq_norm_wavelength_term(
         the denominator of the SANS I(Q) normalization.
         Used by :py:func:`iofq_denominator`.
     """
-    out = incident_monitor * transmission_fraction
+    out = _astype(incident_monitor, dtype) * _astype(transmission_fraction, dtype)
     if direct_beam is not None:
+        direct_beam = _astype(direct_beam, dtype)
         # Make wavelength the inner dim
         dims = list(direct_beam.dims)
         dims.remove('wavelength')
         dims.append('wavelength')
         direct_beam = direct_beam.transpose(dims)
         broadcast = _broadcasters[uncertainties]
-        out = direct_beam * broadcast(out, sizes=direct_beam.sizes)
+        out = broadcast(out, sizes=direct_beam.sizes)
+        if (
+            out.sizes == direct_beam.sizes
+            and out.dtype == direct_beam.dtype
+            and (out.variances is not None or direct_beam.variances is None)
+            and set(direct_beam.coords) <= set(out.coords)
+        ):
+            # `out` is a new buffer that already has the final shape (no broadcast
+            # or broadcast with upper-bound variances), so multiply in-place to avoid
+            # allocating another array of the same size. In-place operations neither
+            # promote the dtype nor add variances, so this requires matching inputs.
+            out *= direct_beam
+        else:
+            out = direct_beam * out
     # Convert wavelength coordinate to midpoints for future histogramming
     out.coords['wavelength'] = sc.midpoints(out.coords['wavelength'])
     return NormWavelengthTerm[ScatteringRunType](out)
@@ -233,6 +278,7 @@ def iofq_denominator(
     wavelength_term: NormWavelengthTerm[ScatteringRunType],
     solid_angle: SolidAngle[ScatteringRunType],
     uncertainties: UncertaintyBroadcastMode,
+    dtype: Optional[NormalizationDType],
 ) -> CleanWavelength[ScatteringRunType, Denominator]:
     """
     Compute the denominator term for the I(Q) normalization.
@@ -280,6 +326,8 @@ def iofq_denominator(
     and the pixel dependent term (solid angle) consists of a broadcast operation which
     would introduce correlations, variances are dropped or replaced by an upper-bound
     estimation, depending on the configured mode.
+    In ``drop`` mode, variances of the solid angle are dropped as well, since they
+    would be broadcast along wavelength.
 
     Parameters
     ----------
@@ -291,13 +339,22 @@ def iofq_denominator(
     uncertainties:
         The mode for broadcasting uncertainties. See
         :py:class:`UncertaintyBroadcastMode` for details.
+    dtype:
+        The data type to use for the computation. If ``None``, the data type of the
+        inputs is kept.
 
     Returns
     -------
     :
         The denominator for the SANS I(Q) normalization.
     """  # noqa: E501
+    wavelength_term = _astype(wavelength_term, dtype)
+    solid_angle = _astype(solid_angle, dtype)
     broadcast = _broadcasters[uncertainties]
+    if uncertainties == UncertaintyBroadcastMode.drop:
+        # Variances of the solid angle (if any) would be broadcast along wavelength.
+        # Drop them as well, so the denominator is a single values-only buffer.
+        solid_angle = broadcast(solid_angle, sizes=wavelength_term.sizes)
     denominator = solid_angle * broadcast(wavelength_term, sizes=solid_angle.sizes)
     return CleanWavelength[ScatteringRunType, Denominator](denominator)
 
@@ -338,6 +395,83 @@ def process_wavelength_bands(
     return wavelength_bands
 
 
+def _contiguous_band_edges(bands: sc.Variable) -> Optional[sc.Variable]:
+    """
+    Return the edges of the wavelength bands as a one-dimensional variable if the
+    bands are sorted and contiguous, i.e., the end of each band is the start of the
+    next one. Return ``None`` otherwise.
+    The bands must have the band dimension as the outer dimension.
+    """
+    values = bands.values
+    starts = values[:, 0]
+    ends = values[:, 1]
+    if np.any(starts >= ends) or np.any(starts[1:] != ends[:-1]):
+        return None
+    return sc.array(
+        dims=['wavelength'],
+        values=np.append(starts, ends[-1]),
+        unit=bands.unit,
+        dtype=bands.dtype,
+    )
+
+
+def _bin_contiguous_bands(
+    da: sc.DataArray, edges: sc.Variable, band_dim: str
+) -> sc.DataArray:
+    """
+    Split event data into contiguous wavelength bands using a single binning operation.
+    The result has the same layout as concatenating the bands along ``band_dim``, i.e.,
+    the band dimension is the outer dimension and is removed for a single band.
+    """
+    wav = 'wavelength'
+    out = da.bin(wavelength=edges).drop_coords(wav).rename_dims({wav: band_dim})
+    if out.sizes[band_dim] == 1:
+        return out.squeeze(band_dim)
+    return out.transpose([band_dim, *(dim for dim in out.dims if dim != band_dim)])
+
+
+def _band_ranges(bands: sc.Variable) -> list[tuple[sc.Variable, sc.Variable]]:
+    """
+    Return the start and end wavelength of every band as scalar variables.
+    The band edges are read from the underlying array in one go, which is cheaper than
+    iterating over ``sc.collapse(bands, keep='wavelength')``.
+    The bands must have the band dimension as the outer dimension.
+    """
+    unit = bands.unit
+    dtype = bands.dtype
+    return [
+        (
+            sc.scalar(start, unit=unit, dtype=dtype),
+            sc.scalar(end, unit=unit, dtype=dtype),
+        )
+        for start, end in bands.values
+    ]
+
+
+def _reduce_bands(
+    da: sc.DataArray,
+    band_ranges: list[tuple[sc.Variable, sc.Variable]],
+    band_dim: str,
+) -> sc.DataArray:
+    """
+    Reduce the wavelength dimension of ``da`` inside each wavelength band.
+    Parts are collected and concatenated only once along ``band_dim``, and the band
+    dimension is omitted for a single band.
+    """
+    wav = 'wavelength'
+    is_events = da.bins is not None
+
+    def _reduce(part: sc.DataArray) -> sc.DataArray:
+        if part.sizes[wav] == 1:  # Can avoid costly event-data da.bins.concat
+            return part.squeeze(wav)
+        return part.bins.concat(wav) if is_events else part.sum(wav)
+
+    parts = [_reduce(da[wav, start:end]) for start, end in band_ranges]
+    if len(parts) == 1:
+        return parts[0]
+    return sc.concat(parts, band_dim)
+
+
 def normalize(
     numerator: FinalSummedQ[ScatteringRunType, Numerator],
     denominator: FinalSummedQ[ScatteringRunType, Denominator],
@@ -372,31 +506,33 @@ def normalize(
         The input data normalized by the supplied denominator.
     """
     wav = 'wavelength'
-    wavelength_bounds = sc.sort(wavelength_bands.flatten(to=wav), wav)
-    if numerator.bins is not None:
-        # If in event mode the desired wavelength binning has not been applied, we need
-        # it for splitting by bands, or restricting the range in case of a single band.
-        numerator = numerator.bin(wavelength=wavelength_bounds)
-
-    def _reduce(da: sc.DataArray) -> sc.DataArray:
-        if da.sizes[wav] == 1:  # Can avoid costly event-data da.bins.concat
-            return da.squeeze(wav)
-        return da.sum(wav) if da.bins is None else da.bins.concat(wav)
-
-    num_parts = []
-    denom_parts = []
-    for wav_range in sc.collapse(wavelength_bands, keep=wav).values():
-        num_parts.append(_reduce(numerator[wav, wav_range[0] : wav_range[1]]))
-        denom_parts.append(_reduce(denominator[wav, wav_range[0] : wav_range[1]]))
     band_dim = (set(wavelength_bands.dims) - {'wavelength'}).pop()
-    if len(num_parts) == 1:
-        numerator = num_parts[0]
-        denominator = denom_parts[0]
+    # Transposing is cheap, and gives a (band, 2) view of the edges for all helpers
+    bands = wavelength_bands.transpose([band_dim, wav])
+    edges = _contiguous_band_edges(bands) if numerator.bins is not None else None
+    band_ranges = _band_ranges(bands)
+    if edges is not None:
+        # Binning once yields exactly one bin per band, so there is no need to slice
+        # and concatenate the events of each band.
+        numerator = _bin_contiguous_bands(numerator, edges, band_dim=band_dim)
     else:
-        numerator = sc.concat(num_parts, band_dim)
-        denominator = sc.concat(denom_parts, band_dim)
-    numerator.coords[wav] = wavelength_bands.squeeze()
-    denominator.coords[wav] = wavelength_bands.squeeze()
+        if numerator.bins is not None:
+            # If in event mode the desired wavelength binning has not been applied, we
+            # need it for splitting by bands.
+            wavelength_bounds = sc.array(
+                dims=[wav],
+                values=np.sort(bands.values, axis=None),
+                unit=bands.unit,
+                dtype=bands.dtype,
+            )
+            numerator = numerator.bin(wavelength=wavelength_bounds)
+        numerator = _reduce_bands(numerator, band_ranges, band_dim=band_dim)
+    denominator = _reduce_bands(denominator, band_ranges, band_dim=band_dim)
+    # Only the band dim can have length 1, the wavelength dim always has length 2
+    if wavelength_bands.sizes[band_dim] == 1:
+        wavelength_bands = wavelength_bands.squeeze(band_dim)
+    numerator.coords[wav] = wavelength_bands
+    denominator.coords[wav] = wavelength_bands
 
     if return_events and numerator.bins is not None:
         # Naive event-mode normalization is not correct if norm-term has variances.
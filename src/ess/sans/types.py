@@ -93,6 +93,11 @@ See https://doi.org/10.3233/JNR-220049 for context.
 ReturnEvents = NewType('ReturnEvents', bool)
 """Whether to return events in the output I(Q)"""
 
+NormalizationDType = NewType('NormalizationDType', str)
+"""Data type used for computing the wavelength-dependent normalization term and the
+I(Q) denominator, e.g., ``'float32'`` to halve the memory footprint. If not set, the
+data type of the inputs is kept."""
+
 WavelengthBins = NewType('WavelengthBins', sc.Variable)
 """Wavelength binning"""
 
@@ -1,9 +1,12 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
+import numpy as np
 import pytest
 import scipp as sc
 
 from ess import sans
+from ess.sans.common import mask_range
+from ess.sans.types import UncertaintyBroadcastMode
 
 
 def test_no_bank_merge_returns_input() -> None:
@@ -61,3 +64,162 @@ def test_merge_banks_or_runs_concats_bins(merge_func) -> None:
         data=expected_events,
     )
     assert sc.identical(merge_func(data), expected)
+
+
+def _make_direct_beam(wavelength: sc.Variable) -> sc.DataArray:
+    return sc.DataArray(
+        data=sc.ones(sizes={'wavelength': wavelength.sizes['wavelength'] - 1}),
+        coords={'wavelength': wavelength},
+    )
+
+
+def test_resample_direct_beam_returns_input_if_binning_matches() -> None:
+    wavelength = sc.linspace('wavelength', 1.0, 10.0, num=11, unit='angstrom')
+    direct_beam = _make_direct_beam(wavelength)
+    assert sans.i_of_q.resample_direct_beam(direct_beam, wavelength) is direct_beam
+    resampled = sans.i_of_q.resample_direct_beam(direct_beam, wavelength.copy())
+    assert resampled is direct_beam
+
+
+def test_resample_direct_beam_interpolates_if_binning_differs() -> None:
+    wavelength = sc.linspace('wavelength', 1.0, 10.0, num=11, unit='angstrom')
+    # interp1d requires point coords, not bin edges
+    direct_beam = _make_direct_beam(wavelength).assign_coords(
+        wavelength=sc.midpoints(wavelength)
+    )
+    shifted = wavelength.copy()
+    shifted.values[5] += 0.1
+    for bins in (shifted, wavelength[:-1]):
+        result = sans.i_of_q.resample_direct_beam(direct_beam, bins)
+        assert result is not direct_beam
+        assert sc.identical(result.coords['wavelength'], bins)
+
+
+_non_background_ranges = [
+    sc.array(dims=['wavelength'], values=[3.5, 7.2], unit='angstrom'),
+    sc.array(dims=['wavelength'], values=[3.0, 7.0], unit='angstrom'),
+    sc.array(dims=['wavelength'], values=[0.35, 0.72], unit='nm'),
+    # Extends beyond the coordinate
+    sc.array(dims=['wavelength'], values=[0.0, 4.5], unit='angstrom'),
+    sc.array(dims=['wavelength'], values=[8.5, 12.0], unit='angstrom'),
+    # Entirely inside a single bin
+    sc.array(dims=['wavelength'], values=[3.2, 3.6], unit='angstrom'),
+]
+
+
+def _make_monitor() -> sc.DataArray:
+    rng = np.random.default_rng(seed=1234)
+    wavelength = sc.linspace('wavelength', 1.0, 10.0, num=10, unit='angstrom')
+    values = 100.0 * rng.random(9)
+    return sc.DataArray(
+        data=sc.array(
+            dims=['wavelength'],
+            values=values,
+            variances=rng.random(9) * values,
+            unit='counts',
+        ),
+        coords={'wavelength': wavelength},
+    )
+
+
+def _mask_range_mean(
+    monitor: sc.DataArray, non_background_range: sc.Variable
+) -> sc.Variable:
+    mask = sc.DataArray(
+        data=sc.array(dims=['wavelength'], values=[True]),
+        coords={'wavelength': non_background_range},
+    )
+    return mask_range(monitor, mask=mask).mean().data
+
+
+@pytest.mark.parametrize('non_background_range', _non_background_ranges)
+def test_mean_outside_range_matches_mask_range(non_background_range) -> None:
+    monitor = _make_monitor()
+    expected = _mask_range_mean(monitor, non_background_range)
+    result = sans.i_of_q._mean_outside_range(monitor, non_background_range)
+    assert result.unit == expected.unit
+    assert sc.allclose(sc.values(result), sc.values(expected))
+    assert sc.allclose(sc.variances(result), sc.variances(expected))
+
+
+@pytest.mark.parametrize('non_background_range', _non_background_ranges)
+def test_preprocess_monitor_data_subtracts_mean_background(
+    non_background_range,
+) -> None:
+    monitor = _make_monitor()
+    background = _mask_range_mean(monitor, non_background_range)
+    result = sans.i_of_q.preprocess_monitor_data(
+        monitor,
+        wavelength_bins=monitor.coords['wavelength'],
+        non_background_range=non_background_range,
+        uncertainties=UncertaintyBroadcastMode.drop,
+    )
+    assert sc.allclose(result.data, (monitor - sc.values(background)).data)
+
+
+def _make_binned_q_data(n_event: int = 100) -> sc.DataArray:
+    rng = np.random.default_rng(seed=1234)
+    events = sc.DataArray(
+        data=sc.ones(dims=['event'], shape=[n_event], unit='counts'),
+        coords={
+            name: sc.array(
+                dims=['event'], values=rng.random(n_event), unit='1/angstrom'
+            )
+            for name in ('Q', 'Qx', 'Qy')
+        },
+    )
+    begin = sc.arange('spectrum', 0, n_event, n_event // 10, unit=None)
+    binned = sc.DataArray(sc.bins(begin=begin, dim='event', data=events))
+    return binned.fold(dim='spectrum', sizes={'layer': 2, 'spectrum': 5})
+
+
+def test_bin_in_q_event_data_sums_all_pixels() -> None:
+    data = _make_binned_q_data()
+    q_bins = sc.linspace('Q', 0.0, 1.0, num=11, unit='1/angstrom')
+    result = sans.i_of_q.bin_in_q(data, q_bins=q_bins, qxy_bins=None, dims_to_keep=None)
+    assert result.dims == ('Q',)
+    assert sc.identical(result.coords['Q'], q_bins)
+    q = data.bins.constituents['data'].coords['Q'].values
+    expected, _ = np.histogram(q, bins=q_bins.values)
+    np.testing.assert_array_equal(result.hist().values, expected)
+
+
+def test_bin_in_q_event_data_keeps_dims_to_keep() -> None:
+    data = _make_binned_q_data()
+    q_bins = sc.linspace('Q', 0.0, 1.0, num=11, unit='1/angstrom')
+    result = sans.i_of_q.bin_in_q(
+        data, q_bins=q_bins, qxy_bins=None, dims_to_keep=('layer',)
+    )
+    assert result.dims == ('layer', 'Q')
+    q = data.bins.constituents['data'].coords['Q'].values
+    # Each layer holds half of the spectra and thus half of the events
+    expected = [np.histogram(part, bins=q_bins.values)[0] for part in np.split(q, 2)]
+    np.testing.assert_array_equal(result.hist().values, expected)
+
+
+def test_bin_in_q_event_data_with_qxy_bins() -> None:
+    data = _make_binned_q_data()
+    qxy_bins = {
+        'Qx': sc.linspace('Qx', 0.0, 1.0, num=6, unit='1/angstrom'),
+        'Qy': sc.linspace('Qy', 0.0, 1.0, num=4, unit='1/angstrom'),
+    }
+    result = sans.i_of_q.bin_in_q(
+        data, q_bins=None, qxy_bins=qxy_bins, dims_to_keep=None
+    )
+    assert result.dims == ('Qy', 'Qx')
+    events = data.bins.constituents['data']
+    expected, _, _ = np.histogram2d(
+        events.coords['Qy'].values,
+        events.coords['Qx'].values,
+        bins=[qxy_bins['Qy'].values, qxy_bins['Qx'].values],
+    )
+    np.testing.assert_array_equal(result.hist().values, expected)
+
+
+def test_mean_outside_range_raises_if_range_is_reversed() -> None:
+    monitor = _make_monitor()
+    non_background_range = sc.array(
+        dims=['wavelength'], values=[7.2, 3.5], unit='angstrom'
+    )
+    with pytest.raises(sc.BinEdgeError):
+        sans.i_of_q._mean_outside_range(monitor, non_background_range)
@@ -3,6 +3,7 @@
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 import sciline
 import scipp as sc
@@ -14,6 +15,7 @@ from ess.sans.types import (
     BackgroundSubtractedIofQ,
     BeamCenter,
     CalibratedMaskedData,
+    CleanWavelength,
     CleanWavelengthMasked,
     CorrectForGravity,
     Denominator,
@@ -24,6 +26,7 @@ from ess.sans.types import (
     FinalSummedQ,
     IofQ,
     NeXusDetectorName,
+    NormalizationDType,
     Numerator,
     PixelMaskFilename,
     QBins,
@@ -110,6 +113,24 @@ def test_pipeline_can_compute_IofQ_in_event_mode(uncertainties, target, qxy: boo
     )
 
 
+def test_pipeline_can_compute_IofQ_with_float32_normalization():
+    params = make_params()
+    pipeline = sciline.Pipeline(loki_providers(), params=params)
+    pipeline.set_param_series(PixelMaskFilename, ['mask_new_July2022.xml'])
+    reference = pipeline.compute(IofQ[SampleRun])
+    pipeline[NormalizationDType] = 'float32'
+    denominator = pipeline.compute(CleanWavelength[SampleRun, Denominator])
+    assert denominator.dtype == 'float32'
+    result = pipeline.compute(IofQ[SampleRun])
+    assert result.dims == reference.dims
+    assert sc.allclose(
+        sc.values(reference.data).to(dtype='float64'),
+        sc.values(result.data).to(dtype='float64'),
+        rtol=sc.scalar(1e-4),
+        equal_nan=True,
+    )
+
+
 @pytest.mark.parametrize('qxy', [False, True])
 def test_pipeline_can_compute_IofQ_in_wavelength_bands(qxy: bool):
     params = make_params(qxy=qxy)
@@ -126,6 +147,31 @@ def test_pipeline_can_compute_IofQ_in_wavelength_bands(qxy: bool):
     assert result.sizes['band'] == 10
 
 
+@pytest.mark.parametrize('qxy', [False, True])
+def test_pipeline_can_compute_IofQ_in_wavelength_bands_in_event_mode(qxy: bool):
+    params = make_params(qxy=qxy)
+    params[WavelengthBands] = sc.linspace(
+        'wavelength',
+        params[WavelengthBins].min(),
+        params[WavelengthBins].max(),
+        11,
+    )
+    results = {}
+    for return_events in (True, False):
+        params[ReturnEvents] = return_events
+        pipeline = sciline.Pipeline(loki_providers(), params=params)
+        pipeline.set_param_series(PixelMaskFilename, ['mask_new_July2022.xml'])
+        results[return_events] = pipeline.compute(IofQ[SampleRun])
+    result = results[True]
+    assert result.bins is not None
+    assert result.dims == (('band', 'Qy', 'Qx') if qxy else ('band', 'Q'))
+    assert result.sizes['band'] == 10
+    # Empty Q bins are NaN in the dense result, but zero in the histogrammed events
+    expected = results[False].values
+    finite = np.isfinite(expected)
+    np.testing.assert_allclose(result.hist().values[finite], expected[finite])
+
+
 @pytest.mark.parametrize('qxy', [False, True])
 def test_pipeline_can_compute_IofQ_in_overlapping_wavelength_bands(qxy: bool):
     params = make_params(qxy=qxy)
@@ -7,6 +7,7 @@ import scipp as sc
 
 from ess.isissans.data import get_path
 from ess.sans import normalization
+from ess.sans.types import UncertaintyBroadcastMode
 
 # See https://github.com/mantidproject/mantid/blob/main/instrument/SANS2D_Definition_Tubes.xml  # noqa: E501
 _SANS2D_PIXEL_RADIUS = 0.00405 * sc.Unit('m')
@@ -184,3 +185,283 @@ def test_transmission_fraction():
             direct_transmission_monitor=direct_transmission_monitor,
         ).data,
     )
+
+
+def _make_normalize_inputs(
+    *, prebinned: bool
+) -> tuple[sc.DataArray, sc.DataArray, sc.Variable]:
+    rng = np.random.default_rng(seed=1234)
+    n_event = 1000
+    wavelength_bins = sc.linspace('wavelength', 1.0, 9.0, num=9, unit='angstrom')
+    q_bins = sc.linspace('Q', 0.0, 1.0, num=6, unit='1/angstrom')
+    events = sc.DataArray(
+        data=sc.ones(dims=['event'], shape=[n_event], unit='counts'),
+        coords={
+            'wavelength': sc.array(
+                dims=['event'], values=rng.uniform(1.0, 9.0, n_event), unit='angstrom'
+            ),
+            'Q': sc.array(
+                dims=['event'], values=rng.random(n_event), unit='1/angstrom'
+            ),
+        },
+    )
+    if prebinned:
+        numerator = events.bin(Q=q_bins, wavelength=wavelength_bins)
+    else:
+        numerator = events.bin(Q=q_bins)
+    denominator = sc.DataArray(
+        data=sc.array(dims=['wavelength', 'Q'], values=rng.uniform(1.0, 2.0, (8, 5))),
+        coords={'wavelength': wavelength_bins, 'Q': q_bins},
+    )
+    return numerator, denominator, wavelength_bins
+
+
+def _normalize_reference(
+    numerator: sc.DataArray, denominator: sc.DataArray, bands: sc.Variable
+) -> np.ndarray:
+    # Band edges are aligned with the bin edges of the denominator
+    events = numerator.bins.constituents['data']
+    wavelength = events.coords['wavelength'].values
+    q = events.coords['Q'].values
+    q_edges = denominator.coords['Q'].values
+    wavelength_edges = denominator.coords['wavelength'].values
+    expected = []
+    for start, end in bands.transpose(['band', 'wavelength']).values:
+        selected = (wavelength >= start) & (wavelength < end)
+        counts, _ = np.histogram(q[selected], bins=q_edges)
+        in_band = (wavelength_edges[:-1] >= start) & (wavelength_edges[1:] <= end)
+        expected.append(counts / denominator.values[in_band].sum(axis=0))
+    return np.array(expected)
+
+
+@pytest.mark.parametrize(
+    'wavelength_bands',
+    [
+        None,
+        # Contiguous
+        sc.linspace('wavelength', 1.0, 9.0, num=5, unit='angstrom'),
+        # Non-contiguous and unsorted
+        sc.array(
+            dims=['band', 'wavelength'],
+            values=[[6.0, 8.0], [1.0, 3.0], [4.0, 5.0]],
+            unit='angstrom',
+        ),
+        # Overlapping
+        sc.array(
+            dims=['band', 'wavelength'],
+            values=[[1.0, 5.0], [3.0, 7.0], [6.0, 9.0]],
+            unit='angstrom',
+        ),
+    ],
+)
+@pytest.mark.parametrize('prebinned', [False, True])
+@pytest.mark.parametrize('return_events', [False, True])
+def test_normalize_event_data_in_wavelength_bands(
+    wavelength_bands, prebinned, return_events
+) -> None:
+    numerator, denominator, wavelength_bins = _make_normalize_inputs(
+        prebinned=prebinned
+    )
+    bands = normalization.process_wavelength_bands(wavelength_bands, wavelength_bins)
+    expected = _normalize_reference(numerator, denominator, bands)
+    result = normalization.normalize(
+        numerator,
+        denominator,
+        return_events=return_events,
+        uncertainties=UncertaintyBroadcastMode.drop,
+        wavelength_bands=bands,
+    )
+    assert (result.bins is not None) == return_events
+    if return_events:
+        result = result.hist()
+    if bands.sizes['band'] == 1:
+        assert result.dims == ('Q',)
+        expected = expected[0]
+    else:
+        assert result.dims == ('band', 'Q')
+    np.testing.assert_allclose(result.values, expected)
+
+
+def _make_denominator_inputs() -> tuple[sc.DataArray, sc.DataArray]:
+    wavelength_term = sc.DataArray(
+        data=sc.array(
+            dims=['wavelength'], values=[1.0, 2.0, 3.0], variances=[0.1, 0.2, 0.3]
+        ),
+        coords={'wavelength': sc.linspace('wavelength', 1.0, 4.0, num=4)},
+    )
+    solid_angle = sc.DataArray(
+        data=sc.array(dims=['spectrum'], values=[0.5, 0.25], variances=[0.01, 0.02])
+    )
+    return wavelength_term, solid_angle
+
+
+def test_iofq_denominator_drops_solid_angle_variances_in_drop_mode() -> None:
+    wavelength_term, solid_angle = _make_denominator_inputs()
+    denominator = normalization.iofq_denominator(
+        wavelength_term,
+        solid_angle,
+        uncertainties=UncertaintyBroadcastMode.drop,
+        dtype=None,
+    )
+    assert denominator.variances is None
+    assert sc.identical(
+        denominator, sc.values(solid_angle) * sc.values(wavelength_term)
+    )
+
+
+@pytest.mark.parametrize(
+    'uncertainties',
+    [UncertaintyBroadcastMode.upper_bound, UncertaintyBroadcastMode.fail],
+)
+def test_iofq_denominator_raises_if_solid_angle_variances_are_broadcast(
+    uncertainties,
+) -> None:
+    wavelength_term, solid_angle = _make_denominator_inputs()
+    with pytest.raises(sc.VariancesError):
+        normalization.iofq_denominator(
+            wavelength_term, solid_angle, uncertainties=uncertainties, dtype=None
+        )
+
+
+@pytest.mark.parametrize(
+    'uncertainties',
+    [
+        UncertaintyBroadcastMode.drop,
+        UncertaintyBroadcastMode.upper_bound,
+        UncertaintyBroadcastMode.fail,
+    ],
+)
+def test_iofq_norm_wavelength_term_keeps_direct_beam_variances(uncertainties) -> None:
+    wavelength = sc.linspace('wavelength', 1.0, 4.0, num=4, unit='angstrom')
+    incident_monitor = sc.DataArray(
+        data=sc.array(dims=['wavelength'], values=[2.0, 8.0, 18.0], unit='counts'),
+        coords={'wavelength': wavelength},
+    )
+    transmission_fraction = sc.DataArray(
+        data=sc.array(dims=['wavelength'], values=[0.5, 0.5, 0.5]),
+        coords={'wavelength': wavelength},
+    )
+    direct_beam = sc.DataArray(
+        data=sc.array(
+            dims=['wavelength'], values=[0.2, 0.4, 0.6], variances=[0.1, 0.1, 0.1]
+        ),
+        coords={'wavelength': wavelength},
+    )
+    result = normalization.iofq_norm_wavelength_term(
+        incident_monitor,
+        transmission_fraction,
+        direct_beam,
+        uncertainties=uncertainties,
+        dtype=None,
+    )
+    expected = direct_beam * (incident_monitor * transmission_fraction)
+    assert sc.allclose(result.data, expected.data)
+    np.testing.assert_allclose(result.variances, [0.1, 1.6, 8.1])
+    assert sc.identical(result.coords['wavelength'], sc.midpoints(wavelength))
+
+
+def _make_transmission_monitors(
+    *, incident_variances: bool, transmission_dtype: str
+) -> dict[str, sc.DataArray]:
+    wavelength = sc.linspace('wavelength', 1.0, 4.0, num=4, unit='angstrom')
+
+    def monitor(values, *, variances, dtype='float64'):
+        return sc.DataArray(
+            data=sc.array(
+                dims=['wavelength'],
+                values=values,
+                variances=values if variances else None,
+                unit='counts',
+                dtype=dtype,
+            ),
+            coords={'wavelength': wavelength},
+        )
+
+    return dict(
+        sample_incident_monitor=monitor(
+            [100.0, 110.0, 120.0], variances=incident_variances
+        ),
+        sample_transmission_monitor=monitor(
+            [50.0, 60.0, 70.0], variances=False, dtype=transmission_dtype
+        ),
+        direct_incident_monitor=monitor(
+            [90.0, 100.0, 110.0], variances=incident_variances
+        ),
+        direct_transmission_monitor=monitor(
+            [80.0, 85.0, 90.0], variances=False, dtype=transmission_dtype
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    ('incident_variances', 'transmission_dtype'),
+    [(True, 'float64'), (False, 'float32'), (True, 'float32')],
+)
+def test_transmission_fraction_with_mixed_variances_and_dtypes(
+    incident_variances, transmission_dtype
+) -> None:
+    monitors = _make_transmission_monitors(
+        incident_variances=incident_variances, transmission_dtype=transmission_dtype
+    )
+    trans_frac = normalization.transmission_fraction(**monitors)
+    expected = (
+        monitors['sample_transmission_monitor']
+        / monitors['direct_transmission_monitor']
+    ) * (monitors['direct_incident_monitor'] / monitors['sample_incident_monitor'])
+    assert trans_frac.dtype == expected.dtype == sc.DType.float64
+    assert (trans_frac.variances is not None) == incident_variances
+    assert sc.allclose(trans_frac.data, expected.data)
+
+
+def _compute_denominator(dtype) -> tuple[sc.DataArray, sc.DataArray]:
+    wavelength = sc.linspace('wavelength', 1.0, 4.0, num=4, unit='angstrom')
+    incident_monitor = sc.DataArray(
+        data=sc.array(
+            dims=['wavelength'],
+            values=[2.0, 8.0, 18.0],
+            variances=[2.0, 8.0, 18.0],
+            unit='counts',
+        ),
+        coords={'wavelength': wavelength},
+    )
+    transmission_fraction = sc.DataArray(
+        data=sc.array(dims=['wavelength'], values=[0.3, 0.5, 0.7]),
+        coords={'wavelength': wavelength},
+    )
+    direct_beam = sc.DataArray(
+        data=sc.array(dims=['wavelength'], values=[0.2, 0.4, 0.6]),
+        coords={'wavelength': wavelength},
+    )
+    solid_angle = sc.DataArray(
+        data=sc.array(dims=['spectrum'], values=[1e-3, 2e-3], unit='sr')
+    )
+    wavelength_term = normalization.iofq_norm_wavelength_term(
+        incident_monitor,
+        transmission_fraction,
+        direct_beam,
+        uncertainties=UncertaintyBroadcastMode.drop,
+        dtype=dtype,
+    )
+    denominator = normalization.iofq_denominator(
+        wavelength_term,
+        solid_angle,
+        uncertainties=UncertaintyBroadcastMode.drop,
+        dtype=dtype,
+    )
+    return wavelength_term, denominator
+
+
+@pytest.mark.parametrize(
+    ('dtype', 'expected_dtype'),
+    [(None, sc.DType.float64), ('float32', sc.DType.float32)],
+)
+def test_normalization_terms_use_normalization_dtype(dtype, expected_dtype) -> None:
+    wavelength_term, denominator = _compute_denominator(dtype)
+    reference_term, reference = _compute_denominator(None)
+    assert wavelength_term.dtype == expected_dtype
+    assert denominator.dtype == expected_dtype
+    rtol = sc.scalar(1e-6)
+    assert sc.allclose(
+        wavelength_term.data.astype('float64'), reference_term.data, rtol=rtol
+    )
+    assert sc.allclose(denominator.data.astype('float64'), reference.data, rtol=rtol)